@@ -1,11 +1,30 @@
 # -*- coding: utf-8 -*-
 """Drux modules."""
 
+from importlib import import_module
 from .params import DRUX_VERSION
-from .higuchi import HiguchiModel, HiguchiParameters
-from .zero_order import ZeroOrderModel, ZeroOrderParameters
-from .first_order import FirstOrderModel, FirstOrderParameters
-from .weibull import WeibullModel, WeibullParameters
-from .hopfenberg import HopfenbergModel, HopfenbergParameters
+
+_LAZY_ATTRIBUTES = {
+    "HiguchiModel": ".higuchi",
+    "HiguchiParameters": ".higuchi",
+    "ZeroOrderModel": ".zero_order",
+    "ZeroOrderParameters": ".zero_order",
+    "FirstOrderModel": ".first_order",
+    "FirstOrderParameters": ".first_order",
+    "WeibullModel": ".weibull",
+    "WeibullParameters": ".weibull",
+    "HopfenbergModel": ".hopfenberg",
+    "HopfenbergParameters": ".hopfenberg",
+    "clear_time_grid_cache": ".base_model",
+}
+
+__all__ = ["DRUX_VERSION", *_LAZY_ATTRIBUTES]
 
 __version__ = DRUX_VERSION
+
+
+def __getattr__(name):
+    """Import model classes and helpers (and numpy with them) on first access."""
+    if name in _LAZY_ATTRIBUTES:
+        return getattr(import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
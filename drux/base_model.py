@@ -1,8 +1,8 @@
 """This file contains the abstract base class for drug release models."""
 
 import numpy as np
-import matplotlib.pyplot as plt
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from typing import Any, Optional
 
 from .messages import (
@@ -12,9 +12,33 @@ from .messages import (
     ERROR_NO_SIMULATION_DATA,
     ERROR_RELEASE_PROFILE_TOO_SHORT,
     ERROR_TARGET_RELEASE_EXCEEDS_MAX,
+    ERROR_INVALID_OUTPUT_ARRAY,
+    ERROR_INVALID_DTYPE,
 )
 
 
+@lru_cache(maxsize=2)
+def _time_grid(duration: float, time_step: float, dtype: str = "float64") -> tuple:
+    """
+    Build the (read-only) simulation time grid and its square root.
+
+    :param duration: total time for simulation (in seconds)
+    :param time_step: time step for simulation (in seconds)
+    :param dtype: floating point type name of the grid
+    """
+    n = int(round(duration / time_step)) + 1
+    time_points = np.linspace(0.0, duration, n, dtype=dtype)
+    sqrt_time_points = np.sqrt(time_points)
+    time_points.setflags(write=False)
+    sqrt_time_points.setflags(write=False)
+    return time_points, sqrt_time_points
+
+
+def clear_time_grid_cache() -> None:
+    """Release the cached simulation time grids."""
+    _time_grid.cache_clear()
+
+
 class DrugReleaseModel(ABC):
     """
     Abstract base class for drug release models.
@@ -23,20 +47,39 @@ class DrugReleaseModel(ABC):
     mathematical models of drug release from delivery systems.
 
     Subclasses should implement:
-    - _model_function(): Core model equation
+    - _model_array(): Core model equation (vectorized over time points)
     - _validate_parameters(): Parameter validation
     """
 
     def __init__(self):
         """Initialize the drug release model."""
         self._time_points = None
+        self._sqrt_time_points = None
+        self._time_step = None
         self._release_profile = None
+        self._monotonic = False
+        self._validated = False
         self._plot_parameters = {
             "xlabel": "Time (s)",
             "ylabel": "Cumulative Release",
             "title": "Drug Release Profile",
             "label": "Release Profile"}
 
+    @property
+    def _parameters(self) -> Any:
+        """Model parameters."""
+        return self._model_parameters
+
+    @_parameters.setter
+    def _parameters(self, parameters: Any) -> None:
+        """
+        Set model parameters and mark them for re-validation.
+
+        :param parameters: model parameters dataclass
+        """
+        self._model_parameters = parameters
+        self._validated = False
+
     @abstractmethod
     def _validate_parameters(self) -> None:
         """
@@ -47,17 +90,32 @@ class DrugReleaseModel(ABC):
         pass
 
     @abstractmethod
-    def _model_function(self, t: float) -> float:
+    def _model_array(self, t: np.ndarray, out: np.ndarray) -> np.ndarray:
         """
         Model function that calculates drug release profile over time.
 
-        :param t: time point at which to calculate drug release
+        :param t: time points at which to calculate drug release
+        :param out: array (same shape as t) to write the drug release into
         """
         pass
 
-    def _get_release_profile(self) -> np.ndarray:
-        """Calculate the drug release profile over the specified time points."""
-        return np.vectorize(self._model_function)(self._time_points)
+    def _model_function(self, t: float) -> float:
+        """
+        Calculate the drug release at a single time point.
+
+        :param t: time point at which to calculate drug release
+        """
+        return float(self._model_array(np.asarray(t), np.empty(())))
+
+    def _get_release_profile(self, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Calculate the drug release profile over the specified time points.
+
+        :param out: optional array to write the release profile into
+        """
+        if out is None:
+            out = np.empty_like(self._time_points)
+        return self._model_array(self._time_points, out)
 
     def _validate_plot(self) -> tuple:
         """
@@ -71,23 +129,57 @@ class DrugReleaseModel(ABC):
 
         if len(self._release_profile) < 2:
             raise ValueError(ERROR_RELEASE_PROFILE_TOO_SHORT)
+        import matplotlib.pyplot as plt
         fig, ax = plt.subplots()
         return fig, ax
 
-    def simulate(self, duration: int, time_step: float = 1) -> np.ndarray:
+    @staticmethod
+    def _validate_time_grid(duration: int, time_step: float) -> None:
         """
-        Simulate drug release over time.
+        Validate simulation duration and time step.
 
         :param duration: total time for simulation (in seconds)
         :param time_step: time step for simulation (in seconds)
+        :raises ValueError: if duration or time_step is not positive
+        :raises ValueError: if time_step is greater than duration
         """
         if duration <= 0 or time_step <= 0:
             raise ValueError(ERROR_DURATION_TIME_STEP_POSITIVE)
         if time_step > duration:
             raise ValueError(ERROR_TIME_STEP_GREATER_THAN_DURATION)
-        self._time_points = np.arange(0, duration + time_step, time_step)
-        self._validate_parameters()
-        self._release_profile = self._get_release_profile()
+
+    def simulate(
+            self,
+            duration: int,
+            time_step: float = 1,
+            dtype: Any = np.float64,
+            out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Simulate drug release over time.
+
+        :param duration: total time for simulation (in seconds)
+        :param time_step: time step for simulation (in seconds)
+        :param dtype: floating point type of the simulation (np.float64 or np.float32 for large grids)
+        :param out: optional preallocated array (one element per time point, simulation dtype) for the release profile
+        """
+        self._validate_time_grid(duration, time_step)
+        try:
+            dtype = np.dtype(dtype)
+        except TypeError:
+            raise ValueError(ERROR_INVALID_DTYPE)
+        if dtype not in (np.float32, np.float64):
+            raise ValueError(ERROR_INVALID_DTYPE)
+        self._time_points, self._sqrt_time_points = _time_grid(duration, time_step, dtype.name)
+        self._time_step = duration / (len(self._time_points) - 1)
+        if out is not None and (
+                not isinstance(out, np.ndarray) or
+                out.shape != self._time_points.shape or
+                out.dtype != self._time_points.dtype):
+            raise ValueError(ERROR_INVALID_OUTPUT_ARRAY)
+        if not self._validated:
+            self._validate_parameters()
+            self._validated = True
+        self._release_profile = self._get_release_profile(out)
         return self._release_profile
 
     def plot(
@@ -134,8 +226,13 @@ class DrugReleaseModel(ABC):
         if len(self._release_profile) < 2:
             raise ValueError(ERROR_RELEASE_PROFILE_TOO_SHORT)
 
-        # Calculate the derivative of the release profile
-        release_rate = np.gradient(self._release_profile, self._time_points)
+        # Calculate the derivative of the release profile on the uniform time grid
+        release_profile = self._release_profile
+        time_step = self._time_step
+        release_rate = np.empty_like(release_profile)
+        release_rate[1:-1] = (release_profile[2:] - release_profile[:-2]) * (0.5 / time_step)
+        release_rate[0] = (release_profile[1] - release_profile[0]) / time_step
+        release_rate[-1] = (release_profile[-1] - release_profile[-2]) / time_step
         return release_rate
 
     def time_for_release(self, target_release: float) -> float:
@@ -158,5 +255,8 @@ class DrugReleaseModel(ABC):
             raise ValueError(ERROR_TARGET_RELEASE_EXCEEDS_MAX)
 
         # Find first time point where release >= target
-        idx = np.argmax(self._release_profile >= target_release)
+        if self._monotonic:
+            idx = np.searchsorted(self._release_profile, target_release, side="left")
+        else:
+            idx = np.argmax(self._release_profile >= target_release)
         return self._time_points[idx]
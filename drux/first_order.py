@@ -1,12 +1,12 @@
 # -*- coding: utf-8 -*-
 """Drux first-order model implementation."""
-from math import exp
+import numpy as np
 from .base_model import DrugReleaseModel
 from .messages import ERROR_FIRST_ORDER_INITIAL_AMOUNT, ERROR_FIRST_ORDER_RELEASE_RATE
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(frozen=True)
 class FirstOrderParameters:
     """
     Parameters for the first-order model.
@@ -32,24 +32,29 @@ class FirstOrderModel(DrugReleaseModel):
         """
         super().__init__()
         self._parameters = FirstOrderParameters(k=k, M0=M0)
+        self._monotonic = True
         self._plot_parameters["label"] = "First-Order Model"
 
     def __repr__(self):
         """Return a string representation of the First-Order model."""
         return f"drux.FirstOrderModel(k={self._parameters.k}, M0={self._parameters.M0})"
 
-    def _model_function(self, t: float) -> float:
+    def _model_array(self, t: np.ndarray, out: np.ndarray) -> np.ndarray:
         """
-        Calculate the drug release at time t using the first-order model.
+        Calculate the drug release at time points t using the first-order model.
 
         Formula:
         - M(t) = M0 * (1 - exp(-k * t))
-        :param t: time (s)
+        :param t: time points (s)
+        :param out: array (same shape as t) to write the drug release into
         """
         M0 = self._parameters.M0
         k = self._parameters.k
 
-        Mt = M0 * (1 - exp(-k * t))
+        Mt = np.multiply(-k, t, out=out)
+        np.exp(Mt, out=Mt)
+        np.subtract(1, Mt, out=Mt)
+        Mt *= M0
 
         return Mt
 
@@ -1,18 +1,57 @@
 # -*- coding: utf-8 -*-
 """Drux Higuchi model implementation."""
 
-from .base_model import DrugReleaseModel
+import numpy as np
+from .base_model import DrugReleaseModel, _time_grid
 from .messages import (
     ERROR_INVALID_DIFFUSION,
     ERROR_INVALID_CONCENTRATION,
     ERROR_INVALID_SOLUBILITY,
     ERROR_SOLUBILITY_HIGHER_THAN_CONCENTRATION,
+    ERROR_INVALID_BATCH_PARAMETERS,
 )
 from dataclasses import dataclass
 from math import sqrt
+from typing import Any, Optional
 
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
 
-@dataclass
+
+if njit is not None:  # pragma: no cover
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _higuchi_batch(D, c0, cs, sqrt_t, out):
+        """
+        Calculate Higuchi release profiles of a parameter batch with a parallel JIT-compiled loop.
+
+        :param D: drug diffusivities (cm^2/s)
+        :param c0: initial drug concentrations (mg/cm^3)
+        :param cs: drug solubilities (mg/cm^3)
+        :param sqrt_t: square root of time points
+        :param out: output array with shape (len(D), len(sqrt_t))
+        """
+        for i in prange(D.shape[0]):
+            coefficient = np.sqrt(D[i] * (2 * c0[i] - cs[i]) * cs[i])
+            for j in range(sqrt_t.shape[0]):
+                out[i, j] = coefficient * sqrt_t[j]
+else:
+    def _higuchi_batch(D, c0, cs, sqrt_t, out):
+        """
+        Calculate Higuchi release profiles of a parameter batch with NumPy broadcasting.
+
+        :param D: drug diffusivities (cm^2/s)
+        :param c0: initial drug concentrations (mg/cm^3)
+        :param cs: drug solubilities (mg/cm^3)
+        :param sqrt_t: square root of time points
+        :param out: output array with shape (len(D), len(sqrt_t))
+        """
+        coefficients = np.sqrt(D * (2 * c0 - cs) * cs)
+        np.multiply(coefficients[:, None], sqrt_t[None, :], out=out)
+
+
+@dataclass(frozen=True)
 class HiguchiParameters:
     """
     Parameters for the Higuchi model based on physical formulation.
@@ -41,6 +80,9 @@ class HiguchiModel(DrugReleaseModel):
         """
         super().__init__()
         self._parameters = HiguchiParameters(D=D, c0=c0, cs=cs)
+        self._coefficient = None
+        self._coefficient_parameters = None
+        self._monotonic = True
         self._plot_parameters["label"] = "Higuchi Model"
 
     def __repr__(self):
@@ -50,22 +92,77 @@ class HiguchiModel(DrugReleaseModel):
             f"c0={self._parameters.c0}, cs={self._parameters.cs})"
         )
 
-    def _model_function(self, t: float) -> float:
+    @staticmethod
+    def simulate_batch(D: Any, c0: Any, cs: Any, duration: int, time_step: float = 1) -> np.ndarray:
         """
-        Calculate the drug release at time t using the Higuchi model.
+        Simulate drug release over time for a batch of Higuchi parameter sets.
+
+        :param D: Drug diffusivities in the polymer carrier (cm^2/s), 1-D array-like or scalar
+        :param c0: Initial drug concentrations (mg/cm^3), 1-D array-like or scalar
+        :param cs: Drug solubilities in the polymer (mg/cm^3), 1-D array-like or scalar
+        :param duration: total time for simulation (in seconds)
+        :param time_step: time step for simulation (in seconds)
+        :return: release profiles with shape (number of parameter sets, number of time points)
+        """
+        DrugReleaseModel._validate_time_grid(duration, time_step)
+        parameters = np.atleast_1d(D, c0, cs)
+        if any(x.ndim != 1 for x in parameters):
+            raise ValueError(ERROR_INVALID_BATCH_PARAMETERS)
+        try:
+            D, c0, cs = (x.astype(np.float64) for x in np.broadcast_arrays(*parameters))
+        except ValueError:
+            raise ValueError(ERROR_INVALID_BATCH_PARAMETERS)
+        if np.any(D <= 0):
+            raise ValueError(ERROR_INVALID_DIFFUSION)
+        if np.any(c0 <= 0):
+            raise ValueError(ERROR_INVALID_CONCENTRATION)
+        if np.any(cs <= 0):
+            raise ValueError(ERROR_INVALID_SOLUBILITY)
+        if np.any(cs > c0):
+            raise ValueError(ERROR_SOLUBILITY_HIGHER_THAN_CONCENTRATION)
+
+        _, sqrt_time_points = _time_grid(duration, time_step, "float64")
+        profiles = np.empty((D.shape[0], sqrt_time_points.shape[0]), dtype=np.float64)
+        _higuchi_batch(D, c0, cs, sqrt_time_points, profiles)
+        return profiles
+
+    def _model_array(self, t: np.ndarray, out: np.ndarray) -> np.ndarray:
+        """
+        Calculate the drug release at time points t using the Higuchi model.
 
         Formula:
         - General case: Mt = sqrt(D * c0 * (2*c0 - cs) * cs * t)
-        :param t: time (s)
+        :param t: time points (s)
+        :param out: array (same shape as t) to write the drug release into
         """
-        D = self._parameters.D
-        c0 = self._parameters.c0
-        cs = self._parameters.cs
-
-        Mt = sqrt(D * (2 * c0 - cs) * cs * t)
+        Mt = np.sqrt(t, out=out)
+        Mt *= self._get_coefficient()
 
         return Mt
 
+    def _get_release_profile(self, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Calculate the drug release profile over the specified time points.
+
+        :param out: optional array to write the release profile into
+        """
+        if out is None:
+            out = np.empty_like(self._time_points)
+        coefficient = self._sqrt_time_points.dtype.type(self._get_coefficient())
+        np.multiply(coefficient, self._sqrt_time_points, out=out)
+        return out
+
+    def _get_coefficient(self) -> float:
+        """Return the time-invariant coefficient of the Higuchi model, computed once per parameter set."""
+        if self._coefficient_parameters is not self._parameters:
+            D = self._parameters.D
+            c0 = self._parameters.c0
+            cs = self._parameters.cs
+
+            self._coefficient = sqrt(D * (2 * c0 - cs) * cs)
+            self._coefficient_parameters = self._parameters
+        return self._coefficient
+
     def _validate_parameters(self) -> None:
         """Validate the parameters of the Higuchi model."""
         if self._parameters.D <= 0:
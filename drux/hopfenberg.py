@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 """Drux Hopfenberg model implementation."""
 
+import numpy as np
 from .base_model import DrugReleaseModel
 from .messages import (
     ERROR_INVALID_EROSION_CONSTANT,
@@ -12,7 +13,24 @@ from .messages import (
 from dataclasses import dataclass
 
 
-@dataclass
+def _slab_power(x: np.ndarray) -> None:
+    """Raise x to the power 1 in place for slab geometry (n=1)."""
+
+
+def _cylinder_power(x: np.ndarray) -> None:
+    """Raise x to the power 2 in place for cylinder geometry (n=2)."""
+    x *= x
+
+
+def _sphere_power(x: np.ndarray) -> None:
+    """Raise x to the power 3 in place for sphere geometry (n=3)."""
+    x *= x * x
+
+
+_GEOMETRY_POWERS = {1: _slab_power, 2: _cylinder_power, 3: _sphere_power}
+
+
+@dataclass(frozen=True)
 class HopfenbergParameters:
     """
     Parameters for the Hopfenberg model based on surface erosion.
@@ -56,25 +74,30 @@ class HopfenbergModel(DrugReleaseModel):
             f"n={self._parameters.n})"
         )
 
-    def _model_function(self, t: float) -> float:
+    def _model_array(self, t: np.ndarray, out: np.ndarray) -> np.ndarray:
         """
-        Calculate the fractional drug release at time t using the Hopfenberg model.
+        Calculate the fractional drug release at time points t using the Hopfenberg model.
 
         Formula:
         - Mt = M∞(1 - (1 - k0*t / (c0*a0))^n)
 
-        :param t: time (s)
+        :param t: time points (s)
+        :param out: array (same shape as t) to write the drug release into
         :return: drug release
         """
         M = self._parameters.M
         k0 = self._parameters.k0
         c0 = self._parameters.c0
         a0 = self._parameters.a0
-        n = self._parameters.n
+        geometry_power = _GEOMETRY_POWERS[self._parameters.n]
 
-        inner_term = 1 - (k0 * t) / (c0 * a0)
+        erosion_rate = k0 / (c0 * a0)
+        Mt = np.multiply(-erosion_rate, t, out=out)
+        Mt += 1
 
-        Mt = M * (1 - (inner_term**n))
+        geometry_power(Mt)
+        np.subtract(1, Mt, out=Mt)
+        Mt *= M
 
         return Mt
 
@@ -12,6 +12,10 @@ ERROR_TARGET_RELEASE_RANGE = "Target release must be non-negative."
 ERROR_TARGET_RELEASE_EXCEEDS_MAX = (
     "Target release exceeds maximum release of the simulated duration."
 )
+ERROR_INVALID_DTYPE = "Simulation dtype must be float32 or float64."
+ERROR_INVALID_OUTPUT_ARRAY = (
+    "Output array must have one element per time point and the simulation dtype."
+)
 
 # Error messages for Higuchi
 ERROR_INVALID_DIFFUSION = "Diffusivity (D) must be positive."
@@ -20,6 +24,9 @@ ERROR_INVALID_SOLUBILITY = "Solubility (cs) must be positive."
 ERROR_SOLUBILITY_HIGHER_THAN_CONCENTRATION = (
     "Solubility (cs) must be lower or equal to initial concentration (c0)."
 )
+ERROR_INVALID_BATCH_PARAMETERS = (
+    "Batch parameters (D, c0, cs) must be scalars or 1-D arrays of the same length."
+)
 
 # Error messages for zero-order
 ERROR_ZERO_ORDER_RELEASE_RATE = "Release rate (k0) must be non-negative."
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 """Drux Weibull model implementation."""
 
+import numpy as np
 from .base_model import DrugReleaseModel
 from .messages import (
     ERROR_WEIBULL_SCALE_PARAMETER,
@@ -8,10 +9,9 @@ from .messages import (
     ERROR_WEIBULL_SHAPE_PARAMETER,
 )
 from dataclasses import dataclass
-from math import exp
 
 
-@dataclass
+@dataclass(frozen=True)
 class WeibullParameters:
     """
     Parameters for the Weibull model based on physical formulation.
@@ -40,25 +40,31 @@ class WeibullModel(DrugReleaseModel):
         """
         super().__init__()
         self._parameters = WeibullParameters(M=M, a=a, b=b)
+        self._monotonic = True
         self._plot_parameters["label"] = "Weibull Model"
 
     def __repr__(self):
         """Return a string representation of the Weibull model."""
         return f"drux.WeibullModel(M={self._parameters.M}, a={self._parameters.a}, b={self._parameters.b})"
 
-    def _model_function(self, t: float) -> float:
+    def _model_array(self, t: np.ndarray, out: np.ndarray) -> np.ndarray:
         """
-        Calculate the drug release at time t using the Weibull model.
+        Calculate the drug release at time points t using the Weibull model.
 
         Formula:
         - General case: Mt = M * (1 - exp(-a*t ** b))
-        :param t: time (s)
+        :param t: time points (s)
+        :param out: array (same shape as t) to write the drug release into
         """
         M = self._parameters.M
         a = self._parameters.a
         b = self._parameters.b
 
-        Mt = M * (1 - exp(-a * t**b))
+        Mt = np.power(t, b, out=out)
+        Mt *= -a
+        np.exp(Mt, out=Mt)
+        np.subtract(1, Mt, out=Mt)
+        Mt *= M
 
         return Mt
 
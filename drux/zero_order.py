@@ -1,12 +1,13 @@
 # -*- coding: utf-8 -*-
 """Drux zero-order model implementation."""
 
+import numpy as np
 from .base_model import DrugReleaseModel
 from .messages import ERROR_ZERO_ORDER_RELEASE_RATE, ERROR_ZERO_ORDER_INITIAL_AMOUNT
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(frozen=True)
 class ZeroOrderParameters:
     """
     Parameters for the Zero-order model.
@@ -32,24 +33,27 @@ class ZeroOrderModel(DrugReleaseModel):
         """
         super().__init__()
         self._parameters = ZeroOrderParameters(k0=k0, M0=M0)
+        self._monotonic = True
         self._plot_parameters["label"] = "Zero-Order Model"
 
     def __repr__(self):
         """Return a string representation of the Zero-Order model."""
         return f"drux.ZeroOrderModel(k0={self._parameters.k0}, M0={self._parameters.M0})"
 
-    def _model_function(self, t: float) -> float:
+    def _model_array(self, t: np.ndarray, out: np.ndarray) -> np.ndarray:
         """
-        Calculate the drug release at time t using the zero-order model.
+        Calculate the drug release at time points t using the zero-order model.
 
         Formula:
         - M(t) = M0 + k0 * t
-        :param t: time (s)
+        :param t: time points (s)
+        :param out: array (same shape as t) to write the drug release into
         """
         M0 = self._parameters.M0
         k0 = self._parameters.k0
 
-        Mt = M0 + k0 * t
+        Mt = np.multiply(k0, t, out=out)
+        Mt += M0
 
         return Mt
 
@@ -1,10 +1,11 @@
 """Tests for the Higuchi model implementation in drux package."""
 
 from pytest import raises
-from numpy import isclose
-from math import sqrt
+from numpy import isclose, allclose, arange, empty, sqrt, float32, int32
 from re import escape
-from drux import HiguchiModel
+from pickle import dumps, loads
+from drux import HiguchiModel, HiguchiParameters, clear_time_grid_cache
+from drux.base_model import _time_grid
 
 TEST_CASE_NAME = "Higuchi model tests"
 D, C0, CS = 1e-6, 1, 0.5
@@ -19,6 +20,11 @@ def test_higuchi_parameters():
     assert model._parameters.cs == CS
 
 
+def test_higuchi_model_function():
+    model = HiguchiModel(D=D, c0=C0, cs=CS)
+    assert isclose(model._model_function(100), sqrt(D * 100 * (2 * C0 - CS) * CS))
+
+
 def test_invalid_parameters():
     with raises(ValueError, match=escape("Diffusivity (D) must be positive.")):
         HiguchiModel(D=-D, c0=C0, cs=CS).simulate(duration=SIM_DURATION, time_step=SIM_TIME_STEP)
@@ -33,11 +39,104 @@ def test_invalid_parameters():
         HiguchiModel(D=D, c0=0.5, cs=1).simulate(duration=SIM_DURATION, time_step=SIM_TIME_STEP)
 
 
+def test_higuchi_parameters_replacement():
+    model = HiguchiModel(D=D, c0=C0, cs=CS)
+    model.simulate(duration=SIM_DURATION, time_step=SIM_TIME_STEP)
+    model._parameters = HiguchiParameters(D=2 * D, c0=C0, cs=CS)
+    profile = model.simulate(duration=SIM_DURATION, time_step=SIM_TIME_STEP)
+    assert isclose(profile[-1], sqrt(2 * D * SIM_DURATION * (2 * C0 - CS) * CS))
+    model._parameters = HiguchiParameters(D=-D, c0=C0, cs=CS)
+    with raises(ValueError, match=escape("Diffusivity (D) must be positive.")):
+        model.simulate(duration=SIM_DURATION, time_step=SIM_TIME_STEP)
+
+
+def test_higuchi_pickle():
+    model = HiguchiModel(D=D, c0=C0, cs=CS)
+    profile = model.simulate(duration=SIM_DURATION, time_step=SIM_TIME_STEP)
+    restored = loads(dumps(model))
+    assert restored._parameters == model._parameters
+    assert allclose(restored.simulate(duration=SIM_DURATION, time_step=SIM_TIME_STEP), profile)
+
+
 def test_higuchi_simulation():  # Reference: https://www.sciencedirect.com/science/article/abs/pii/S0022354915333037
     model = HiguchiModel(D=D, c0=C0, cs=CS)
     profile = model.simulate(duration=SIM_DURATION, time_step=SIM_TIME_STEP)
-    actual_release = [sqrt(D * t * (2 * C0 - CS) * CS) for t in range(0, 1001, 10)]
-    assert all(isclose(p, a, rtol=RELATIVE_TOLERANCE) for p, a in zip(profile, actual_release))
+    t = arange(0, 1001, 10)
+    actual_release = sqrt(D * t * (2 * C0 - CS) * CS)
+    assert allclose(profile, actual_release, rtol=RELATIVE_TOLERANCE)
+
+
+def test_higuchi_simulation_float32():
+    model = HiguchiModel(D=D, c0=C0, cs=CS)
+    profile = model.simulate(duration=SIM_DURATION, time_step=SIM_TIME_STEP, dtype=float32)
+    t = arange(0, 1001, 10)
+    actual_release = sqrt(D * t * (2 * C0 - CS) * CS)
+    assert profile.dtype == float32
+    assert allclose(profile, actual_release, rtol=1e-3)
+    assert model.get_release_rate().dtype == float32
+    assert model.simulate(duration=SIM_DURATION, time_step=SIM_TIME_STEP).dtype == "float64"
+
+
+def test_higuchi_simulation_dtype_error():
+    model = HiguchiModel(D=D, c0=C0, cs=CS)
+
+    with raises(ValueError, match="Simulation dtype must be float32 or float64."):
+        model.simulate(duration=SIM_DURATION, time_step=SIM_TIME_STEP, dtype=int32)
+
+    with raises(ValueError, match="Simulation dtype must be float32 or float64."):
+        model.simulate(duration=SIM_DURATION, time_step=SIM_TIME_STEP, dtype="not-a-dtype")
+
+
+def test_higuchi_simulation_out():
+    model = HiguchiModel(D=D, c0=C0, cs=CS)
+    actual_release = sqrt(D * arange(0, 1001, 10) * (2 * C0 - CS) * CS)
+    profile1 = model.simulate(duration=SIM_DURATION, time_step=SIM_TIME_STEP)
+    profile2 = model.simulate(duration=SIM_DURATION / 10, time_step=SIM_TIME_STEP / 10)
+    assert len(profile2) == 101
+    assert allclose(profile1, actual_release)
+    out = empty(101)
+    assert model.simulate(duration=SIM_DURATION, time_step=SIM_TIME_STEP, out=out) is out
+    assert allclose(out, actual_release)
+
+    with raises(ValueError, match="Output array must have one element per time point and the simulation dtype."):
+        model.simulate(duration=SIM_DURATION, time_step=SIM_TIME_STEP, out=empty(10))
+
+    with raises(ValueError, match="Output array must have one element per time point and the simulation dtype."):
+        model.simulate(duration=SIM_DURATION, time_step=SIM_TIME_STEP, out=empty(101, dtype=float32))
+
+
+def test_higuchi_simulate_batch():
+    Ds, C0s, CSs = [D, 2 * D, D], [C0, C0, 2 * C0], [CS, CS, CS]
+    profiles = HiguchiModel.simulate_batch(Ds, C0s, CSs, duration=SIM_DURATION, time_step=SIM_TIME_STEP)
+    assert profiles.shape == (3, 101)
+    for profile, d, c0, cs in zip(profiles, Ds, C0s, CSs):
+        expected = HiguchiModel(D=d, c0=c0, cs=cs).simulate(duration=SIM_DURATION, time_step=SIM_TIME_STEP)
+        assert allclose(profile, expected, rtol=1e-12)
+
+
+def test_higuchi_simulate_batch_shares_time_grid():
+    clear_time_grid_cache()
+    assert _time_grid.cache_info().currsize == 0
+    HiguchiModel(D=D, c0=C0, cs=CS).simulate(duration=SIM_DURATION, time_step=SIM_TIME_STEP)
+    HiguchiModel.simulate_batch(D, C0, CS, duration=SIM_DURATION, time_step=SIM_TIME_STEP)
+    assert _time_grid.cache_info().currsize == 1
+
+
+def test_higuchi_simulate_batch_errors():
+    with raises(ValueError, match=escape("Diffusivity (D) must be positive.")):
+        HiguchiModel.simulate_batch([D, -D], C0, CS, duration=SIM_DURATION, time_step=SIM_TIME_STEP)
+
+    with raises(ValueError, match=escape("Solubility (cs) must be lower or equal to initial concentration (c0).")):
+        HiguchiModel.simulate_batch(D, [C0, 0.5], [CS, 1], duration=SIM_DURATION, time_step=SIM_TIME_STEP)
+
+    with raises(ValueError, match="Time step cannot be greater than duration"):
+        HiguchiModel.simulate_batch(D, C0, CS, duration=10, time_step=20)
+
+    with raises(ValueError, match="must be scalars or 1-D arrays of the same length"):
+        HiguchiModel.simulate_batch([[D, D]], C0, CS, duration=SIM_DURATION, time_step=SIM_TIME_STEP)
+
+    with raises(ValueError, match="must be scalars or 1-D arrays of the same length"):
+        HiguchiModel.simulate_batch([D, D], [C0, C0, C0], CS, duration=SIM_DURATION, time_step=SIM_TIME_STEP)
 
 
 def test_higuchi_simulation_errors():
@@ -96,10 +195,10 @@ def test_higuchi_release_rate():  # Reference: https://www.wolframalpha.com/inpu
     model = HiguchiModel(D=D, c0=C0, cs=CS)
     model.simulate(duration=SIM_DURATION, time_step=SIM_TIME_STEP)
     rate = model.get_release_rate()
-    actual_rate = [sqrt(D * t * (2 * C0 - CS) * CS) / (2 * t)
-                   for t in range(1, 1001, 10)]  # not defined at t=0, set to 0
+    t = arange(1, 1001, 10)  # not defined at t=0
+    actual_rate = sqrt(D * t * (2 * C0 - CS) * CS) / (2 * t)
     # skip first point to avoid near zero division issues
-    assert all(isclose(r, a, rtol=1e-2) for r, a in zip(rate[10:], actual_rate[10:]))
+    assert allclose(rate[10:-1], actual_rate[10:], rtol=1e-2)
 
 
 def test_higuchi_release_rate_error():
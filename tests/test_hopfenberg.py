@@ -1,9 +1,9 @@
 """Tests for the Hopfenberg model implementation in drux package."""
 
 from pytest import raises
-from numpy import isclose
+from numpy import isclose, allclose, arange
 from re import escape
-from drux import HopfenbergModel
+from drux import HopfenbergModel, HopfenbergParameters
 
 TEST_CASE_NAME = "Hopfenberg model tests"
 M, k0, c0, a0, n = 1, 0.00067, 0.0374, 3.51, 2
@@ -51,6 +51,22 @@ def test_hopfenberg_simulation():  # Reference: https://pmc.ncbi.nlm.nih.gov/art
     assert all(isclose(p, r, rtol=RELATIVE_TOLERANCE) for p, r in zip(profile, actual_release))
 
 
+def test_hopfenberg_simulation_geometries():
+    t = arange(0, SIM_DURATION + SIM_TIME_STEP, SIM_TIME_STEP)
+    for geometry in (1, 2, 3):
+        model = HopfenbergModel(M=M, k0=k0, c0=c0, a0=a0, n=geometry)
+        profile = model.simulate(duration=SIM_DURATION, time_step=SIM_TIME_STEP)
+        assert allclose(profile, M * (1 - (1 - (k0 * t) / (c0 * a0))**geometry))
+
+
+def test_hopfenberg_parameters_replacement():
+    model = HopfenbergModel(M=M, k0=k0, c0=c0, a0=a0, n=1)
+    model.simulate(duration=SIM_DURATION, time_step=SIM_TIME_STEP)
+    model._parameters = HopfenbergParameters(M=M, k0=k0, c0=c0, a0=a0, n=3)
+    profile = model.simulate(duration=SIM_DURATION, time_step=SIM_TIME_STEP)
+    assert isclose(profile[-1], M * (1 - (1 - (k0 * SIM_DURATION) / (c0 * a0))**3))
+
+
 def test_hopfenberg_simulation_errors():
     model = HopfenbergModel(M=M, k0=k0, c0=c0, a0=a0, n=n)
 
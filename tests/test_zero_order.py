@@ -1,8 +1,7 @@
 """Tests for the Zero-order model implementation in drux package."""
 
 from pytest import raises
-from numpy import isclose
-from math import sqrt
+from numpy import isclose, allclose, arange, empty, full_like
 from re import escape
 from drux import ZeroOrderModel
 
@@ -35,8 +34,34 @@ def test_repr():
 def test_zero_order_simulation():  # Reference: https://europepmc.org/article/pmc/3425064
     model = ZeroOrderModel(M0=M0, k0=k0)
     profile = model.simulate(duration=SIM_DURATION, time_step=SIM_TIME_STEP)
-    actual_release = [M0 + (k0 * t) for t in range(0, 1001, 10)]
-    assert all(isclose(p, a, rtol=RELATIVE_TOLERANCE) for p, a in zip(profile, actual_release))
+    t = arange(0, 1001, 10)
+    actual_release = M0 + (k0 * t)
+    assert allclose(profile, actual_release, rtol=RELATIVE_TOLERANCE)
+
+
+def test_zero_order_simulation_float_time_step():
+    model = ZeroOrderModel(M0=M0, k0=k0)
+    profile = model.simulate(duration=1, time_step=0.1)
+    assert len(profile) == 11
+    assert allclose(profile, M0 + (k0 * arange(11) * 0.1))
+    assert profile[-1] == M0 + k0
+
+
+def test_zero_order_simulation_adjusted_time_step():
+    model = ZeroOrderModel(M0=M0, k0=k0)
+    profile = model.simulate(duration=10, time_step=3)  # duration is not a multiple of time_step
+    assert len(profile) == 4
+    assert allclose(profile, M0 + (k0 * arange(4) * 10 / 3))  # effective time step is 10 / 3
+
+
+def test_zero_order_simulation_out():
+    model = ZeroOrderModel(M0=M0, k0=k0)
+    out = empty(101)
+    assert model.simulate(duration=SIM_DURATION, time_step=SIM_TIME_STEP, out=out) is out
+    assert allclose(out, M0 + (k0 * arange(0, 1001, 10)))
+
+    with raises(ValueError, match="Output array must have one element per time point and the simulation dtype."):
+        model.simulate(duration=SIM_DURATION, time_step=SIM_TIME_STEP, out=[0.0] * 101)
 
 
 def test_zero_order_simulation_errors():
@@ -93,8 +118,8 @@ def test_zero_order_release_rate():  # Reference: https://www.wolframalpha.com/i
     model = ZeroOrderModel(M0=M0, k0=k0)
     model.simulate(duration=SIM_DURATION, time_step=SIM_TIME_STEP)
     rate = model.get_release_rate()
-    actual_rate = [k0 for _ in range(0, 1001, 10)]
-    assert all(isclose(r, a, rtol=1e-2) for r, a in zip(rate, actual_rate))
+    actual_rate = full_like(arange(0, 1001, 10), k0, dtype=float)
+    assert allclose(rate, actual_rate, rtol=1e-2)
 
 
 def test_zero_order_release_rate_error():